@@ -1,24 +1,30 @@
 from __future__ import annotations
-from collections import defaultdict
+from collections.abc import Iterable as _Iterable
+import functools
 import re
+import sys
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
     cast,
     Dict,
-    Iterator,
+    FrozenSet,
     Iterable,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Sequence,
+    Tuple,
     Type,
+    TypeVar,
     Union,
 )
 import warnings
 
 from bs4._deprecation import _deprecated
 from bs4.element import (
-    AttributeDict,
     NavigableString,
     PageElement,
     ResultSet,
@@ -26,7 +32,8 @@ from bs4.element import (
 )
 from bs4._typing import (
     _AtMostOneElement,
-    _AttributeValue,
+    _BaseStrainableAttribute,
+    _BaseStrainableElement,
     _NullableStringMatchFunction,
     _OneElement,
     _PageElementMatchFunction,
@@ -68,6 +75,8 @@ class ElementFilter(object):
     `ElementFilter.filter()`.
     """
 
+    __slots__ = ("match_function",)
+
     match_function: Optional[_PageElementMatchFunction]
 
     def __init__(self, match_function: Optional[_PageElementMatchFunction] = None):
@@ -79,6 +88,23 @@ class ElementFilter(object):
         """
         self.match_function = match_function
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle protocols 0 and 1 don't know about __slots__, and a
+        # pickle from before __slots__ was introduced holds a plain
+        # dictionary, so state is always a dictionary.
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                if slot.startswith("__") and not slot.endswith("__"):
+                    slot = f"_{cls.__name__.lstrip('_')}{slot}"
+                if hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for key, value in state.items():
+            setattr(self, key, value)
+
     @property
     def includes_everything(self) -> bool:
         """Does this `ElementFilter` obviously include everything? If so,
@@ -137,14 +163,14 @@ class ElementFilter(object):
         # anything through.
         if self.includes_everything:
             yield from generator
-        while True:
-            try:
-                i = next(generator)
-            except StopIteration:
-                break
-            if i:
-                if self.match(i, _known_rules=True):
-                    yield i
+            return
+
+        # This loop runs once for every element being filtered, so
+        # look up the match method only once.
+        match = self.match
+        for i in generator:
+            if i and match(i, _known_rules=True):
+                yield i
 
     def find(self, generator: Iterator[PageElement]) -> _AtMostOneElement:
         """A lower-level equivalent of :py:meth:`Tag.find`.
@@ -208,15 +234,73 @@ class ElementFilter(object):
         return True
 
 
+# The kinds of MatchRule. Which kind a MatchRule is depends on which
+# of its constructor arguments was provided. Knowing this ahead of
+# time lets a match be run without checking every argument in turn.
+_STRING_RULE = 0
+_PATTERN_RULE = 1
+_FUNCTION_RULE = 2
+_PRESENT_RULE = 3
+_ABSENT_RULE = 4
+_EXCLUDE_EVERYTHING_RULE = 5
+
+# Roughly how expensive it is to check each kind of MatchRule.
+_MATCH_RULE_COST = {
+    _PRESENT_RULE: 0,
+    _ABSENT_RULE: 0,
+    _EXCLUDE_EVERYTHING_RULE: 0,
+    _STRING_RULE: 1,
+    _PATTERN_RULE: 2,
+    _FUNCTION_RULE: 3,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regular expression that was passed in as a string.
+
+    People tend to create a lot of SoupStrainers with the same
+    patterns, so the compiled patterns are cached. This cache is
+    separate from the one in the `re` module, and larger, so other
+    code that compiles a lot of regular expressions won't push
+    these out.
+    """
+    return re.compile(pattern)
+
+
 class MatchRule(object):
     """Each MatchRule encapsulates the logic behind a single argument
     passed in to one of the Beautiful Soup find* methods.
     """
 
+    # A SoupStrainer may hold a large number of MatchRules, so they
+    # don't get a __dict__.
+    __slots__ = (
+        "string",
+        "pattern",
+        "function",
+        "present",
+        "exclude_everything",
+        "_kind",
+        "matches_string",
+    )
+
     string: Optional[str]
     pattern: Optional[_RegularExpressionProtocol]
     present: Optional[bool]
     exclude_everything: Optional[bool]
+    _kind: int
+
+    #: Whether to intern the string given to the constructor. This is
+    #: worthwhile when the string is likely to be compared against
+    #: strings that were themselves interned.
+    _intern_string: bool = False
+
+    #: Check whether a string matches this rule. This is one of the
+    #: _match_* methods, chosen when the rule is created based on what
+    #: kind of rule it is.
+    matches_string: Callable[[Optional[str]], bool]
+
     # TODO-TYPING: All MatchRule objects also have an attribute
     # ``function``, but the type of the function depends on the
     # subclass.
@@ -231,72 +315,126 @@ class MatchRule(object):
     ):
         if isinstance(string, bytes):
             string = string.decode("utf8")
+        if self._intern_string and type(string) is str:
+            string = sys.intern(string)
         self.string = string
-        if isinstance(pattern, bytes):
-            self.pattern = re.compile(pattern.decode("utf8"))
+        if pattern is None or type(pattern) is re.Pattern:
+            # This is the common case: either there's no pattern, or
+            # the caller already compiled it.
+            self.pattern = pattern
+        elif isinstance(pattern, bytes):
+            self.pattern = _compile_pattern(pattern.decode("utf8"))
         elif isinstance(pattern, str):
-            self.pattern = re.compile(pattern)
+            self.pattern = _compile_pattern(pattern)
         else:
             self.pattern = pattern
         self.function = function
         self.present = present
         self.exclude_everything = exclude_everything
 
-        values = [
-            x
-            for x in (self.string, self.pattern, self.function, self.present, self.exclude_everything)
-            if x is not None
-        ]
-        if len(values) == 0:
+        # Count the arguments that were provided without building a
+        # list of them; a lot of rules get created.
+        provided = (
+            (string is not None)
+            + (pattern is not None)
+            + (function is not None)
+            + (present is not None)
+            + (exclude_everything is not None)
+        )
+        if provided == 0:
             raise ValueError(
                 "Either string, pattern, function, present, or exclude_everything must be provided."
             )
-        if len(values) > 1:
+        if provided > 1:
             raise ValueError(
                 "At most one of string, pattern, function, present, and exclude_everything must be provided."
             )
 
-    def _base_match(self, string: Optional[str]) -> Optional[bool]:
-        """Run the 'cheap' portion of a match, trying to get an answer without
-        calling a potentially expensive custom function.
+        self._kind = self._rule_kind()
 
-        :return: True or False if we have a (positive or negative)
-        match; None if we need to keep trying.
-        """
-        # self.exclude_everything matches nothing.
-        if self.exclude_everything:
-            return False
+        # Decide now which method will run matches for this rule, so
+        # matches_string() doesn't have to look at the kind of rule
+        # every time it's called.
+        self.matches_string = self._choose_matcher()
 
-        # self.present==True matches everything except None.
+    def _rule_kind(self) -> int:
+        """Work out which kind of rule this is."""
+        if self.string is not None:
+            return _STRING_RULE
+        if self.pattern is not None:
+            return _PATTERN_RULE
         if self.present is True:
-            return string is not None
-
-        # self.present==False matches _only_ None.
+            return _PRESENT_RULE
         if self.present is False:
-            return string is None
-
+            return _ABSENT_RULE
+        if self.exclude_everything:
+            return _EXCLUDE_EVERYTHING_RULE
+        # Usually this means a function was provided, but a rule that
+        # doesn't restrict anything also ends up here.
+        return _FUNCTION_RULE
+
+    def _choose_matcher(self) -> Callable[[Optional[str]], bool]:
+        """Choose the method that will run matches for this rule."""
+        kind = self._kind
+        if kind == _STRING_RULE:
+            return self._match_string
+        if kind == _PATTERN_RULE:
+            return self._match_pattern
+        if kind == _PRESENT_RULE:
+            return self._match_present
+        if kind == _ABSENT_RULE:
+            return self._match_absent
+        if kind == _EXCLUDE_EVERYTHING_RULE:
+            return self._match_nothing
+        if self.function is not None:
+            return self._match_function
+        return self._match_everything
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # matches_string is one of this rule's own methods, so it's
+        # recreated when the rule is unpickled rather than pickled.
+        state = dict(getattr(self, "__dict__", {}))
+        for slot in MatchRule.__slots__:
+            if slot != "matches_string":
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for key, value in state.items():
+            setattr(self, key, value)
+        # A rule pickled before __slots__ were introduced doesn't
+        # know what kind of rule it is, so always work it out again.
+        self._kind = self._rule_kind()
+        self.matches_string = self._choose_matcher()
+
+    def _match_string(self, string: Optional[str]) -> bool:
         # self.string does an exact string match.
-        if self.string is not None:
-            # print(f"{self.string} ?= {string}")
-            return self.string == string
+        return self.string == string
 
+    def _match_pattern(self, string: Optional[str]) -> bool:
         # self.pattern does a regular expression search.
-        if self.pattern is not None:
-            # print(f"{self.pattern} ?~ {string}")
-            if string is None:
-                return False
-            return self.pattern.search(string) is not None
+        return (
+            string is not None
+            and cast(_RegularExpressionProtocol, self.pattern).search(string)
+            is not None
+        )
 
-        return None
+    def _match_function(self, string: Optional[str]) -> bool:
+        return bool(cast(Callable, self.function)(string))
 
-    def matches_string(self, string: Optional[str]) -> bool:
-        _base_result = self._base_match(string)
-        if _base_result is not None:
-            # No need to invoke the test function.
-            return _base_result
-        if self.function is not None and not self.function(string):
-            # print(f"{self.function}({string}) == False")
-            return False
+    def _match_present(self, string: Optional[str]) -> bool:
+        # self.present==True matches everything except None.
+        return string is not None
+
+    def _match_absent(self, string: Optional[str]) -> bool:
+        # self.present==False matches _only_ None.
+        return string is None
+
+    def _match_nothing(self, string: Optional[str]) -> bool:
+        # self.exclude_everything matches nothing.
+        return False
+
+    def _match_everything(self, string: Optional[str]) -> bool:
         return True
 
     def __repr__(self) -> str:
@@ -316,33 +454,124 @@ class MatchRule(object):
 class TagNameMatchRule(MatchRule):
     """A MatchRule implementing the rules for matches against tag name."""
 
+    __slots__ = ()
+
     function: Optional[_TagMatchFunction]
 
+    # Tag names mostly come from a small vocabulary ("div", "a", "p",
+    # ...), so interning them lets an equality check succeed on
+    # identity alone.
+    _intern_string = True
+
     def matches_tag(self, tag: Tag) -> bool:
-        base_value = self._base_match(tag.name)
-        if base_value is not None:
-            return base_value
-
-        # The only remaining possibility is that the match is determined
-        # by a function call. Call the function.
-        function = cast(_TagMatchFunction, self.function)
-        if function(tag):
-            return True
-        return False
+        if self.function is None:
+            return self.matches_string(tag.name)
+
+        # A function is called with the Tag itself, not its name.
+        return bool(self.function(tag))
 
 
 class AttributeValueMatchRule(MatchRule):
     """A MatchRule implementing the rules for matches against attribute value."""
 
+    __slots__ = ()
+
     function: Optional[_NullableStringMatchFunction]
 
 
 class StringMatchRule(MatchRule):
     """A MatchRule implementing the rules for matches against a NavigableString."""
 
+    __slots__ = ()
+
     function: Optional[_StringMatchFunction]
 
 
+_RuleT = TypeVar("_RuleT", bound=MatchRule)
+
+# A collection of objects, each of which becomes a MatchRule. This is
+# defined once, at module level, so the cast() in
+# SoupStrainer._make_match_rules doesn't build it on every call.
+_RuleSources = Iterable[Union[_BaseStrainableElement, _BaseStrainableAttribute]]
+
+
+# The container types people usually use to pass in several rules at
+# once. Checking for these is faster than the general Iterable check.
+_ITER_TYPES = (list, tuple, set, frozenset)
+_STR_TYPES = (str, bytes)
+
+
+def _is_nonstring_iterable(obj: Any) -> bool:
+    """Is `obj` a collection of rules, rather than a single string?"""
+    if isinstance(obj, _ITER_TYPES):
+        return True
+    return not isinstance(obj, _STR_TYPES) and isinstance(obj, _Iterable)
+
+
+def _match_attribute_values(
+    rules: Tuple[AttributeValueMatchRule, ...],
+    attr_values: Sequence[Optional[str]],
+) -> bool:
+    """Does any of the rules match any of the attribute values?"""
+    for rule in rules:
+        for attr_value in attr_values:
+            if rule.matches_string(attr_value):
+                return True
+    return False
+
+
+def _combine_match_rules(
+    rules: Sequence[MatchRule],
+) -> Optional[re.Pattern]:
+    """Combine several string and pattern rules into a single regular
+    expression that matches wherever any of the rules would match.
+
+    :return: The combined regular expression, or None if any of the
+       rules can't safely be combined with the others.
+    """
+    if len(rules) < 2:
+        return None
+    default_flags = _compile_pattern("").flags
+    parts = []
+    for rule in rules:
+        pattern = rule.pattern
+        if rule._kind == _STRING_RULE:
+            # A string rule only matches the entire string.
+            parts.append(r"\A" + re.escape(cast(str, rule.string)) + r"\Z")
+        elif (
+            rule._kind == _PATTERN_RULE
+            and type(pattern) is re.Pattern
+            and isinstance(pattern.pattern, str)
+            and pattern.flags == default_flags
+            and pattern.groups == 0
+        ):
+            # Flags would apply to the whole combined expression, and
+            # group numbers would shift, so only simple patterns can
+            # be combined.
+            parts.append(f"(?:{pattern.pattern})")
+        else:
+            return None
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
+# Everything needed to check one attribute against a SoupStrainer's
+# rules: the attribute name, its rules, the literal strings to look
+# for (if every rule is a literal string), a single regular expression
+# that can stand in for all of the rules (if there is one), and
+# whether it's worth matching the values of a multi-valued attribute
+# joined into one string.
+_AttributeCheck = Tuple[
+    str,
+    Tuple[AttributeValueMatchRule, ...],
+    Optional[FrozenSet[str]],
+    Optional[re.Pattern],
+    bool,
+]
+
+
 class SoupStrainer(ElementFilter):
     """The `ElementFilter` subclass used internally by Beautiful Soup.
 
@@ -355,7 +584,9 @@ class SoupStrainer(ElementFilter):
 
     Internally, `SoupStrainer` objects work by converting the
     constructor arguments into `MatchRule` objects. Incoming
-    tags/markup are matched against those rules.
+    tags/markup are matched against those rules. The rules are
+    analyzed once, when the `SoupStrainer` is created, so they're
+    stored in tuples that can't be modified afterwards.
 
     :param name: One or more restrictions on the tags found in a document.
 
@@ -371,9 +602,41 @@ class SoupStrainer(ElementFilter):
 
     """
 
-    name_rules: List[TagNameMatchRule]
-    attribute_rules: Dict[str, List[AttributeValueMatchRule]]
-    string_rules: List[StringMatchRule]
+    __slots__ = (
+        "name_rules",
+        "attribute_rules",
+        "string_rules",
+        "_name_literals",
+        "_name_nonliterals",
+        "_name_pattern_union",
+        "_needs_prefixed_name",
+        "_tag_needs_prefixed_name",
+        "_attribute_checks",
+        "_has_name_rules",
+        "_has_string_rules",
+        "_has_tag_rules",
+        "_string_literals",
+        "_string_union",
+        "_string_other_rules",
+        "__string",
+    )
+
+    name_rules: Tuple[TagNameMatchRule, ...]
+    attribute_rules: Mapping[str, Tuple[AttributeValueMatchRule, ...]]
+    string_rules: Tuple[StringMatchRule, ...]
+
+    _name_literals: FrozenSet[str]
+    _name_nonliterals: List[TagNameMatchRule]
+    _name_pattern_union: Optional[re.Pattern]
+    _needs_prefixed_name: bool
+    _tag_needs_prefixed_name: bool
+    _attribute_checks: Tuple[_AttributeCheck, ...]
+    _has_name_rules: bool
+    _has_string_rules: bool
+    _has_tag_rules: bool
+    _string_literals: FrozenSet[str]
+    _string_union: Optional[re.Pattern]
+    _string_other_rules: List[StringMatchRule]
 
     def __init__(
         self,
@@ -394,21 +657,19 @@ class SoupStrainer(ElementFilter):
             # Special case for backwards compatibility. Instantiating
             # a SoupStrainer with no arguments whatsoever gets you one
             # that matches all Tags, and only Tags.
-            self.name_rules = [TagNameMatchRule(present=True)]
+            self.name_rules = (TagNameMatchRule(present=True),)
         else:
-            self.name_rules = cast(
-                List[TagNameMatchRule], list(self._make_match_rules(name, TagNameMatchRule))
-            )
-        self.attribute_rules = defaultdict(list)
+            self.name_rules = tuple(self._make_match_rules(name, TagNameMatchRule))
 
         if attrs is None:
             attrs = {}
-        if not isinstance(attrs, dict):
+        elif not isinstance(attrs, dict):
             # Passing something other than a dictionary as attrs is
             # sugar for matching that thing against the 'class'
             # attribute.
             attrs = {"class": attrs}
 
+        attribute_rules: Dict[str, List[AttributeValueMatchRule]] = {}
         for attrdict in attrs, kwargs:
             for attr, value in attrdict.items():
                 if attr == "class_" and attrdict is kwargs:
@@ -421,14 +682,18 @@ class SoupStrainer(ElementFilter):
 
                 if value is None:
                     value = False
-                for rule_obj in self._make_match_rules(value, AttributeValueMatchRule):
-                    self.attribute_rules[attr].append(
-                        cast(AttributeValueMatchRule, rule_obj)
-                    )
+                rules = self._make_match_rules(value, AttributeValueMatchRule)
+                if rules:
+                    attribute_rules.setdefault(attr, []).extend(rules)
 
-        self.string_rules = cast(
-            List[StringMatchRule], list(self._make_match_rules(string, StringMatchRule))
-        )
+        # The rules are analyzed once, in _prepare_rules(), so they're
+        # stored in forms that can't be changed afterwards.
+        self.attribute_rules = MappingProxyType({
+            (sys.intern(attr) if type(attr) is str else attr): tuple(rules)
+            for attr, rules in attribute_rules.items()
+        })
+
+        self.string_rules = tuple(self._make_match_rules(string, StringMatchRule))
 
         #: DEPRECATED 4.13.0: You shouldn't need to check this under
         #: any name (.string or .text), and if you do, you're probably
@@ -436,13 +701,206 @@ class SoupStrainer(ElementFilter):
         #: variable might have. Look at the .string_rules list instead.
         self.__string = string
 
+        self._prepare_rules()
+
+    def _prepare_rules(self) -> None:
+        """Analyze the rules, so that matches can be run as quickly as
+        possible.
+
+        This is done when the `SoupStrainer` is created, and again
+        when it's unpickled.
+        """
+        # Most SoupStrainers are created by the find* methods and have
+        # at most one rule of each kind, so those cases are handled
+        # without the general analysis below.
+        name_rules = self.name_rules
+        if not name_rules:
+            self._name_literals = frozenset()
+            self._name_nonliterals = []
+            self._name_pattern_union = None
+            self._tag_needs_prefixed_name = self._needs_prefixed_name = False
+        elif len(name_rules) == 1:
+            [name_rule] = name_rules
+            kind = name_rule._kind
+            self._name_pattern_union = None
+            if kind == _STRING_RULE:
+                name = cast(str, name_rule.string)
+                self._name_literals = frozenset((name,))
+                self._name_nonliterals = []
+                self._tag_needs_prefixed_name = ":" in name
+            else:
+                self._name_literals = frozenset()
+                self._name_nonliterals = [name_rule]
+                self._tag_needs_prefixed_name = kind == _PATTERN_RULE
+            self._needs_prefixed_name = (
+                self._tag_needs_prefixed_name or kind == _FUNCTION_RULE
+            )
+        else:
+            self._analyze_name_rules()
+
+        # Everything matches_tag() and allow_tag_creation() need to
+        # check each attribute, gathered into a tuple that can be
+        # iterated over without any dictionary lookups.
+        attribute_checks: List[_AttributeCheck] = []
+        costs: List[int] = []
+        for attr, rules in self.attribute_rules.items():
+            literals: Optional[FrozenSet[str]] = None
+            union: Optional[re.Pattern] = None
+            if len(rules) == 1:
+                [attr_rule] = rules
+                costs.append(_MATCH_RULE_COST[attr_rule._kind])
+                if attr_rule._kind == _STRING_RULE:
+                    value = cast(str, attr_rule.string)
+                    literals = frozenset((value,))
+                    match_joined = " " in value
+                else:
+                    if (
+                        attr_rule._kind == _PATTERN_RULE
+                        and type(attr_rule.pattern) is re.Pattern
+                    ):
+                        # Search with the regular expression directly,
+                        # rather than going through the rule.
+                        union = attr_rule.pattern
+                    match_joined = True
+            else:
+                costs.append(max(_MATCH_RULE_COST[rule._kind] for rule in rules))
+                if all(rule._kind == _STRING_RULE for rule in rules):
+                    # Every rule looks for a specific string, so the
+                    # attribute value can be checked against all of
+                    # them with a set lookup.
+                    literals = frozenset(cast(str, rule.string) for rule in rules)
+                else:
+                    # The rules may still be combinable into a single
+                    # regular expression.
+                    union = _combine_match_rules(rules)
+
+                # Joining two or more values of a multi-valued
+                # attribute creates a string that contains a space. If
+                # every rule for an attribute is a literal string
+                # without a space, there's no point in trying to match
+                # the joined string.
+                match_joined = any(
+                    rule.string is None or " " in rule.string for rule in rules
+                )
+            attribute_checks.append((attr, rules, literals, union, match_joined))
+        if len(attribute_checks) > 1:
+            # Every attribute that has rules must match, so the
+            # attributes are checked in order of how expensive their
+            # rules are. A tag that fails a cheap check never gets to
+            # the expensive ones.
+            order = sorted(range(len(costs)), key=costs.__getitem__)
+            attribute_checks = [attribute_checks[i] for i in order]
+        self._attribute_checks = tuple(attribute_checks)
+
+        string_rules = self.string_rules
+        if not string_rules:
+            self._string_literals = frozenset()
+            self._string_union = None
+            self._string_other_rules = []
+        elif len(string_rules) == 1:
+            [string_rule] = string_rules
+            self._string_union = None
+            if string_rule._kind == _STRING_RULE:
+                self._string_literals = frozenset((cast(str, string_rule.string),))
+                self._string_other_rules = []
+            else:
+                self._string_literals = frozenset()
+                self._string_other_rules = [string_rule]
+        else:
+            self._analyze_string_rules()
+
+        # Which kinds of rules this SoupStrainer has is checked for
+        # nearly every element, so work it out once.
+        #
+        # A SoupStrainer with name or attribute rules can only match
+        # Tags; one without them can only match NavigableStrings.
+        self._has_name_rules = bool(self.name_rules)
+        self._has_string_rules = bool(self.string_rules)
+        self._has_tag_rules = bool(self.name_rules or self.attribute_rules)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        # A mappingproxy can't be pickled.
+        state["attribute_rules"] = dict(self.attribute_rules)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        # A SoupStrainer pickled before __slots__ were introduced keeps
+        # its rules in lists, and has none of the analyzed state.
+        self.name_rules = tuple(self.name_rules)
+        self.attribute_rules = MappingProxyType({
+            attr: tuple(rules) for attr, rules in self.attribute_rules.items()
+        })
+        self.string_rules = tuple(self.string_rules)
+        self._prepare_rules()
+
+    def _analyze_name_rules(self) -> None:
+        # Name rules that look for one specific tag name can all be
+        # checked at once with a set lookup. The rest have to be tried
+        # one at a time.
+        self._name_literals = frozenset(
+            cast(str, rule.string)
+            for rule in self.name_rules
+            if rule._kind == _STRING_RULE
+        )
+        self._name_nonliterals = [
+            rule for rule in self.name_rules if rule._kind != _STRING_RULE
+        ]
+
+        # A tag's prefixed name ("prefix:name") only needs to be
+        # built if some name rule could match it. matches_tag() passes
+        # a function the Tag itself rather than its prefixed name, so
+        # there a function rule doesn't count.
+        self._tag_needs_prefixed_name = any(
+            ":" in literal for literal in self._name_literals
+        ) or any(rule._kind == _PATTERN_RULE for rule in self._name_nonliterals)
+        self._needs_prefixed_name = self._tag_needs_prefixed_name or any(
+            rule._kind == _FUNCTION_RULE for rule in self._name_nonliterals
+        )
+
+        # Similarly, if there are several regular expressions, they
+        # can often be combined and checked with a single search.
+        self._name_pattern_union = _combine_match_rules(
+            [rule for rule in self._name_nonliterals if rule._kind == _PATTERN_RULE]
+        )
+        if self._name_pattern_union is not None:
+            self._name_nonliterals = [
+                rule
+                for rule in self._name_nonliterals
+                if rule._kind != _PATTERN_RULE
+            ]
+
+    def _analyze_string_rules(self) -> None:
+        # As with name rules, literal strings are checked with a set
+        # lookup, and regular expressions are combined into one where
+        # possible. Anything else is checked one rule at a time,
+        # cheapest first.
+        self._string_literals = frozenset(
+            cast(str, rule.string)
+            for rule in self.string_rules
+            if rule._kind == _STRING_RULE
+        )
+        self._string_union = _combine_match_rules(
+            [rule for rule in self.string_rules if rule._kind == _PATTERN_RULE]
+        )
+        self._string_other_rules = sorted(
+            (
+                rule
+                for rule in self.string_rules
+                if rule._kind != _STRING_RULE
+                and (self._string_union is None or rule._kind != _PATTERN_RULE)
+            ),
+            key=lambda rule: _MATCH_RULE_COST[rule._kind],
+        )
+
     @property
     def includes_everything(self) -> bool:
         """Check whether the provided rules will obviously include
         everything. (They might include everything even if this returns `False`,
         but not in an obvious way.)
         """
-        return not self.name_rules and not self.string_rules and not self.attribute_rules
+        return not self._has_tag_rules and not self._has_string_rules
 
     @property
     def excludes_everything(self) -> bool:
@@ -487,14 +945,14 @@ class SoupStrainer(ElementFilter):
         return self.__string
 
     def __repr__(self) -> str:
-        return f"<{self.__class__.__name__} name={self.name_rules} attrs={self.attribute_rules} string={self.string_rules}>"
+        return f"<{self.__class__.__name__} name={list(self.name_rules)} attrs={dict(self.attribute_rules)} string={list(self.string_rules)}>"
 
     @classmethod
     def _make_match_rules(
         cls,
         obj: Optional[Union[_StrainableElement, _StrainableAttribute]],
-        rule_class: Type[MatchRule],
-    ) -> Iterator[MatchRule]:
+        rule_class: Type[_RuleT],
+    ) -> List[_RuleT]:
         """Convert a vaguely-specific 'object' into one or more well-defined
         `MatchRule` objects.
 
@@ -503,39 +961,79 @@ class SoupStrainer(ElementFilter):
         :param rule_class: Create instances of this `MatchRule` subclass.
         """
         if obj is None:
-            return
+            return []
+        rule = cls._make_match_rule(obj, rule_class)
+        if rule is not None:
+            return [rule]
+
+        # obj is a collection of objects, each of which becomes a rule.
+        objs = cast(_RuleSources, obj)
+        rules = []
+        if not objs:
+            # The attribute is being matched against the null set,
+            # which means it should exclude everything.
+            rules.append(rule_class(exclude_everything=True))
+        for o in objs:
+            if o is None:
+                continue
+            if _is_nonstring_iterable(o):
+                # This is almost certainly the user's
+                # mistake. This list contains another list, which
+                # opens up the possibility of infinite
+                # self-reference. In the interests of avoiding
+                # infinite recursion, we'll treat this as an
+                # impossible match and issue a rule that excludes
+                # everything, rather than looking inside.
+                warnings.warn(
+                    f"Ignoring nested list {o!r} to avoid the possibility of infinite recursion.",
+                    stacklevel=5,
+                )
+                rules.append(rule_class(exclude_everything=True))
+                continue
+            rule = cls._make_match_rule(o, rule_class)
+            if rule is not None:
+                rules.append(rule)
+        return rules
+
+    @classmethod
+    def _make_match_rule(
+        cls,
+        obj: Union[_StrainableElement, _StrainableAttribute],
+        rule_class: Type[_RuleT],
+    ) -> Optional[_RuleT]:
+        """Convert a single object into a `MatchRule`.
+
+        :return: A `MatchRule`, or None if ``obj`` is a collection of
+           objects rather than a single object.
+        """
+        # The most common kinds of object are checked for first, by
+        # identity or exact type, before the general isinstance checks.
+        if type(obj) is str:
+            return rule_class(string=obj)
+        if obj is True or obj is False:
+            return rule_class(present=obj)
+        if type(obj) is re.Pattern:
+            return rule_class(pattern=obj)
         if isinstance(obj, (str, bytes)):
-            yield rule_class(string=obj)
-        elif isinstance(obj, bool):
-            yield rule_class(present=obj)
-        elif callable(obj):
-            yield rule_class(function=obj)
-        elif isinstance(obj, _RegularExpressionProtocol):
-            yield rule_class(pattern=obj)
-        elif hasattr(obj, "__iter__"):
-            if not obj:
-                # The attribute is being matched against the null set,
-                # which means it should exclude everything.
-                yield rule_class(exclude_everything=True)
-            for o in obj:
-                if not isinstance(o, (bytes, str)) and hasattr(o, "__iter__"):
-                    # This is almost certainly the user's
-                    # mistake. This list contains another list, which
-                    # opens up the possibility of infinite
-                    # self-reference. In the interests of avoiding
-                    # infinite recursion, we'll treat this as an
-                    # impossible match and issue a rule that excludes
-                    # everything, rather than looking inside.
-                    warnings.warn(
-                        f"Ignoring nested list {o} to avoid the possibility of infinite recursion.",
-                        stacklevel=5,
-                    )
-                    yield rule_class(exclude_everything=True)
-                    continue
-                for x in cls._make_match_rules(o, rule_class):
-                    yield x
-        else:
-            yield rule_class(string=str(obj))
+            return rule_class(string=obj)
+        if isinstance(obj, bool):
+            return rule_class(present=obj)
+        if callable(obj):
+            return rule_class(function=obj)
+        if isinstance(obj, _ITER_TYPES):
+            # The usual containers are never regular expressions, so
+            # there's no need for the expensive Protocol check below.
+            return None
+        if isinstance(obj, re.Pattern) or isinstance(obj, _RegularExpressionProtocol):
+            # Checking for re.Pattern first is much cheaper than
+            # checking against the runtime Protocol, which has to look
+            # up each of the protocol's attributes. The Protocol check
+            # is still needed for objects from the third-party
+            # ``regex`` package.
+            return rule_class(pattern=obj)
+        if _is_nonstring_iterable(obj):
+            return None
+        return rule_class(string=str(obj))
 
     def matches_tag(self, tag: Tag) -> bool:
         """Do the rules of this `SoupStrainer` trigger a match against the
@@ -552,47 +1050,36 @@ class SoupStrainer(ElementFilter):
         but a `SoupStrainer` that *only* contains `StringMatchRule`
         cannot match a `Tag`, only a `NavigableString`.
         """
-        # If there are no rules at all, let anything through.
-        #if self.includes_everything:
-        #    return True
-
         # String rules cannot not match a Tag on their own.
-        if not self.name_rules and not self.attribute_rules:
-            return False
-
-        # Optimization for a very common case where the user is
-        # searching for a tag with one specific name, and we're
-        # looking at a tag with a different name.
-        if (
-            not tag.prefix
-            and len(self.name_rules) == 1
-            and self.name_rules[0].string is not None
-            and tag.name != self.name_rules[0].string
-        ):
+        if not self._has_tag_rules:
             return False
 
         # If there are name rules, at least one must match. It can
         # match either the Tag object itself or the prefixed name of
         # the tag.
-        prefixed_name = None
-        if tag.prefix:
-            prefixed_name = f"{tag.prefix}:{tag.name}"
-        if self.name_rules:
-            name_matches = False
-            for rule in self.name_rules:
-                # attrs = " ".join(
-                #     [f"{k}={v}" for k, v in sorted(tag.attrs.items())]
-                # )
-                # print(f"Testing <{tag.name} {attrs}>{tag.string}</{tag.name}> against {rule}")
-
-                # If the rule contains a function, the function will be called
-                # with `tag`. It will not be called a second time with
-                # `prefixed_name`.
-                if rule.matches_tag(tag) or (
-                        not rule.function and prefixed_name is not None and rule.matches_string(prefixed_name)
-                ):
-                    name_matches = True
-                    break
+        if self._has_name_rules:
+            name = tag.name
+            prefixed_name = None
+            if self._tag_needs_prefixed_name:
+                prefix = tag.prefix
+                if prefix:
+                    prefixed_name = f"{prefix}:{name}"
+            literals = self._name_literals
+            name_matches = name in literals or (
+                prefixed_name is not None and prefixed_name in literals
+            )
+            if not name_matches and self._name_pattern_union is not None:
+                name_matches = self._matches_name_pattern_union(name, prefixed_name)
+            if not name_matches:
+                for rule in self._name_nonliterals:
+                    # If the rule contains a function, the function will be called
+                    # with `tag`. It will not be called a second time with
+                    # `prefixed_name`.
+                    if rule.matches_tag(tag) or (
+                            not rule.function and prefixed_name is not None and rule.matches_string(prefixed_name)
+                    ):
+                        name_matches = True
+                        break
 
             if not name_matches:
                 return False
@@ -600,14 +1087,21 @@ class SoupStrainer(ElementFilter):
         # If there are attribute rules for a given attribute, at least
         # one of them must match. If there are rules for multiple
         # attributes, each attribute must have at least one match.
-        for attr, rules in self.attribute_rules.items():
-            attr_value = tag.get(attr, None)
-            this_attr_match = self._attribute_match(attr_value, rules)
+        tag_attrs = tag.attrs
+        for attr, rules, attr_literals, union, match_joined in self._attribute_checks:
+            attr_value = tag_attrs.get(attr)
+            # A multi-valued attribute is already a list of values.
+            attr_values: Sequence[Optional[str]] = (
+                attr_value if isinstance(attr_value, list) else (attr_value,)
+            )
+            this_attr_match = self._attribute_match(
+                attr_values, rules, attr_literals, union, match_joined
+            )
             if not this_attr_match:
                 return False
 
         # If there are string rules, at least one must match.
-        if self.string_rules:
+        if self._has_string_rules:
             _str = tag.string
             if _str is None:
                 return False
@@ -615,43 +1109,79 @@ class SoupStrainer(ElementFilter):
                 return False
         return True
 
+    def _matches_name_pattern_union(
+        self, name: str, prefixed_name: Optional[str]
+    ) -> bool:
+        # Check a tag name against the combined name patterns.
+        union = cast(re.Pattern, self._name_pattern_union)
+        return union.search(name) is not None or (
+            prefixed_name is not None and union.search(prefixed_name) is not None
+        )
+
     def _attribute_match(
         self,
-        attr_value: Optional[_AttributeValue],
-        rules: Iterable[AttributeValueMatchRule],
+        attr_values: Sequence[Optional[str]],
+        rules: Tuple[AttributeValueMatchRule, ...],
+        literals: Optional[FrozenSet[str]] = None,
+        union: Optional[re.Pattern] = None,
+        match_joined: bool = True,
     ) -> bool:
-        attr_values: Sequence[Optional[str]]
-        if isinstance(attr_value, list):
-            attr_values = attr_value
-        else:
-            attr_values = [cast(str, attr_value)]
-
-        def _match_attribute_value_helper(attr_values: Sequence[Optional[str]]) -> bool:
-            for rule in rules:
-                for attr_value in attr_values:
-                    if rule.matches_string(attr_value):
+        if literals is not None:
+            # Every rule looks for a specific string, so there's no
+            # need to run the rules one at a time.
+            for value in attr_values:
+                try:
+                    if value in literals:
                         return True
+                except TypeError:
+                    # Someone set the attribute to an unhashable
+                    # value, which can't be equal to any of the
+                    # strings anyway.
+                    pass
+            # As in the general case below, a list that isn't exactly
+            # one value also gets a chance to match as a single string.
+            if len(attr_values) == 1 or (len(attr_values) > 1 and not match_joined):
+                return False
+            return " ".join(cast(Sequence[str], attr_values)) in literals
+
+        if union is not None:
+            # All of the rules have been combined into one regular
+            # expression.
+            search = union.search
+            for value in attr_values:
+                if value is not None and search(value) is not None:
+                    return True
+            if len(attr_values) == 1 or (len(attr_values) > 1 and not match_joined):
+                return False
+            return search(" ".join(cast(Sequence[str], attr_values))) is not None
+
+        this_attr_match = _match_attribute_values(rules, attr_values)
+        if this_attr_match or len(attr_values) == 1:
+            return this_attr_match
+
+        # Try again but treat the attribute value as a single
+        # string instead of a list. The result can only be
+        # different if the list of values contains more or less
+        # than one item.
+        if len(attr_values) > 1 and not match_joined:
+            # None of the rules can match a string that contains a
+            # space.
             return False
 
-        this_attr_match = _match_attribute_value_helper(attr_values)
-        if not this_attr_match and len(attr_values) != 1:
-            # Try again but treat the attribute value as a single
-            # string instead of a list. The result can only be
-            # different if the list of values contains more or less
-            # than one item.
-
-            # This cast converts Optional[str] to plain str.
-            #
-            # We know there can't be any None in the list. Beautiful
-            # Soup never uses None as a value of a multi-valued
-            # attribute, and if None is passed in as attr_value, it's
-            # turned into a list with 1 element, which was excluded by
-            # the if statement above.
-            attr_values = cast(Sequence[str], attr_values)
-
-            joined_attr_value = " ".join(attr_values)
-            this_attr_match = _match_attribute_value_helper([joined_attr_value])
-        return this_attr_match
+        # This cast converts Optional[str] to plain str.
+        #
+        # We know there can't be any None in the list. Beautiful
+        # Soup never uses None as a value of a multi-valued
+        # attribute, and if the attribute is missing, callers pass
+        # in a sequence with 1 element, which was excluded by the if
+        # statement above.
+        attr_values = cast(Sequence[str], attr_values)
+
+        joined_attr_value = " ".join(attr_values)
+        for rule in rules:
+            if rule.matches_string(joined_attr_value):
+                return True
+        return False
 
     def allow_tag_creation(
         self, nsprefix: Optional[str], name: str, attrs: Optional[_RawAttributeValues]
@@ -662,34 +1192,50 @@ class SoupStrainer(ElementFilter):
         :param name: The name of the prospective tag.
         :param attrs: The attributes of the prospective tag.
         """
-        if self.string_rules:
+        if self._has_string_rules:
             # A SoupStrainer that has string rules can't be used to
             # manage tag creation, because the string rule can't be
             # evaluated until after the tag and all of its contents
             # have been parsed.
             return False
         prefixed_name = None
-        if nsprefix:
+        if nsprefix and self._needs_prefixed_name:
             prefixed_name = f"{nsprefix}:{name}"
-        if self.name_rules:
+        if self._has_name_rules:
             # At least one name rule must match.
-            name_match = False
-            for rule in self.name_rules:
-                for x in name, prefixed_name:
-                    if x is not None:
-                        if rule.matches_string(x):
-                            name_match = True
-                            break
+            literals = self._name_literals
+            name_match = name in literals or (
+                prefixed_name is not None and prefixed_name in literals
+            )
+            if not name_match and self._name_pattern_union is not None:
+                name_match = self._matches_name_pattern_union(name, prefixed_name)
+            if not name_match:
+                if prefixed_name is None:
+                    name_match = any(
+                        rule.matches_string(name) for rule in self._name_nonliterals
+                    )
+                else:
+                    name_match = any(
+                        rule.matches_string(name) or rule.matches_string(prefixed_name)
+                        for rule in self._name_nonliterals
+                    )
             if not name_match:
                 return False
 
         # For each attribute that has rules, at least one rule must
         # match.
+        if not self._attribute_checks:
+            return True
         if attrs is None:
-            attrs = AttributeDict()
-        for attr, rules in self.attribute_rules.items():
+            attrs = {}
+        for attr, rules, attr_literals, union, match_joined in self._attribute_checks:
             attr_value = attrs.get(attr)
-            if not self._attribute_match(attr_value, rules):
+            attr_values: Sequence[Optional[str]] = (
+                attr_value if isinstance(attr_value, list) else (attr_value,)
+            )
+            if not self._attribute_match(
+                attr_values, rules, attr_literals, union, match_joined
+            ):
                 return False
 
         return True
@@ -699,12 +1245,12 @@ class SoupStrainer(ElementFilter):
         `SoupStrainer` will allow it to be instantiated as a
         `NavigableString` object, or whether it should be ignored.
         """
-        if self.name_rules or self.attribute_rules:
+        if self._has_tag_rules:
             # A SoupStrainer that has name or attribute rules won't
             # match any strings; it's designed to match tags with
             # certain properties.
             return False
-        if not self.string_rules:
+        if not self._has_string_rules:
             # A SoupStrainer with no string rules will match
             # all strings.
             return True
@@ -716,9 +1262,14 @@ class SoupStrainer(ElementFilter):
         """See whether the content of a string matches any of
         this `SoupStrainer`'s string rules.
         """
-        if not self.string_rules:
+        if not self._has_string_rules:
+            return True
+        if string in self._string_literals:
             return True
-        for string_rule in self.string_rules:
+        string_union = self._string_union
+        if string_union is not None and string_union.search(string) is not None:
+            return True
+        for string_rule in self._string_other_rules:
             if string_rule.matches_string(string):
                 return True
         return False
@@ -739,20 +1290,25 @@ class SoupStrainer(ElementFilter):
         # If there are no rules at all, let anything through.
         if not _known_rules and self.includes_everything:
             return True
+        if self._has_tag_rules:
+            # Only a Tag can match.
+            return isinstance(element, Tag) and self.matches_tag(element)
         if isinstance(element, Tag):
-            return self.matches_tag(element)
+            # String rules can't match a Tag on their own.
+            return False
         assert isinstance(element, NavigableString)
-        if not (self.name_rules or self.attribute_rules):
-            # A NavigableString can only match a SoupStrainer that
-            # does not define any name or attribute rules.
-            # Then it comes down to the string rules.
-            return self.matches_any_string_rule(element)
-        return False
+
+        # A NavigableString can only match a SoupStrainer that does
+        # not define any name or attribute rules. Then it comes down
+        # to the string rules.
+        return self.matches_any_string_rule(element)
 
     @_deprecated("allow_tag_creation", "4.13.0")
     def search_tag(self, name: str, attrs: Optional[_RawAttributeValues]) -> bool:
-        """A less elegant version of `allow_tag_creation`. Deprecated as of 4.13.0"""
-        ":meta private:"
+        """A less elegant version of `allow_tag_creation`. Deprecated as of 4.13.0.
+
+        :meta private:
+        """
         return self.allow_tag_creation(None, name, attrs)
 
     @_deprecated("match", "4.13.0")
@@ -1,5 +1,9 @@
+import gc
+import pickle
 import re
+import sys
 import warnings
+import weakref
 import pytest # type:ignore
 
 from . import (
@@ -10,7 +14,10 @@ from typing import (
     Optional,
     Tuple,
 )
-from bs4.element import Tag
+from bs4.element import (
+    NavigableString,
+    Tag,
+)
 from bs4.filter import (
     AttributeValueMatchRule,
     ElementFilter,
@@ -22,6 +29,19 @@ from bs4.filter import (
 from bs4._typing import _RawAttributeValues
 
 
+# Match functions shared by several rows of the parametrized tests below.
+def _is_upper(x):
+    return x.upper() == x
+
+
+def _is_lower(x):
+    return x.lower() == x
+
+
+def _name_is_attribute(t):
+    return t.name in t.attrs
+
+
 class TestElementFilter(SoupTest):
     def test_default_behavior(self):
         # An unconfigured ElementFilter matches absolutely everything.
@@ -196,6 +216,56 @@ class TestMatchRule(SoupTest):
         rule = MatchRule(*constructor_args, **constructor_kwargs)
         assert result == self._tuple(rule)
 
+    def test_string_pattern_compiled_once(self):
+        # A regular expression passed in as a string is compiled once,
+        # and the compiled pattern is reused.
+        rule1 = MatchRule(pattern="^shared$")
+        rule2 = MatchRule(pattern=b"^shared$")
+        assert rule1.pattern is rule2.pattern
+
+    def test_string_rule_does_not_keep_soup_alive(self):
+        # A StringMatchRule is passed NavigableStrings. A strainer
+        # that's kept around mustn't hold on to them, or to the parse
+        # tree they belong to.
+        soup = self.soup("<p>a needle in a haystack</p>")
+        soup_ref = weakref.ref(soup)
+        strainer = SoupStrainer(string=re.compile("needle"))
+        assert 1 == len(strainer.find_all(soup.descendants))
+        del soup
+        gc.collect()
+        assert soup_ref() is None
+
+    @pytest.mark.parametrize(
+        "rule_kwargs",
+        [
+            dict(string="a"),
+            dict(pattern="^a"),
+            dict(present=True),
+            dict(present=False),
+            dict(exclude_everything=True),
+        ],
+    )
+    def test_pickle(self, rule_kwargs):
+        rule = MatchRule(**rule_kwargs)
+        loaded = pickle.loads(pickle.dumps(rule))
+        assert loaded == rule
+        for value in ("abc", "a", None):
+            assert loaded.matches_string(value) == rule.matches_string(value)
+
+    def test_no_instance_dict(self):
+        # MatchRule and its subclasses use __slots__.
+        for cls in (
+            MatchRule,
+            TagNameMatchRule,
+            AttributeValueMatchRule,
+            StringMatchRule,
+        ):
+            rule = cls(string="a")
+            assert not hasattr(rule, "__dict__")
+            loaded = pickle.loads(pickle.dumps(rule))
+            assert type(loaded) is cls
+            assert loaded == rule
+
     def test_empty_match_not_allowed(self):
         with pytest.raises(
             ValueError,
@@ -223,10 +293,12 @@ class TestMatchRule(SoupTest):
             (dict(present=True), None, False),
             (dict(present=False), "any random value", False),
             (dict(present=False), None, True),
-            (dict(function=lambda x: x.upper() == x), "UPPERCASE", True),
-            (dict(function=lambda x: x.upper() == x), "lowercase", False),
-            (dict(function=lambda x: x.lower() == x), "UPPERCASE", False),
-            (dict(function=lambda x: x.lower() == x), "lowercase", True),
+            (dict(exclude_everything=True), "any random value", False),
+            (dict(exclude_everything=True), None, False),
+            (dict(function=_is_upper), "UPPERCASE", True),
+            (dict(function=_is_upper), "lowercase", False),
+            (dict(function=_is_lower), "UPPERCASE", False),
+            (dict(function=_is_lower), "lowercase", True),
         ],
     )
     def test_matches_string(self, rule_kwargs, match_against, result):
@@ -242,18 +314,21 @@ class TestTagNameMatchRule(SoupTest):
             (dict(string="a"), dict(name="ab"), False),
             (dict(pattern="a"), dict(name="a"), True),
             (dict(pattern="a"), dict(name="ab"), True),
+            # A pattern can match anywhere in the tag name, not just
+            # at the start.
+            (dict(pattern="b"), dict(name="ab"), True),
             (dict(pattern="^a$"), dict(name="a"), True),
             (dict(pattern="^a$"), dict(name="ab"), False),
             # This isn't very useful, but it will work.
             (dict(present=True), dict(name="any random value"), True),
             (dict(present=False), dict(name="any random value"), False),
             (
-                dict(function=lambda t: t.name in t.attrs),
+                dict(function=_name_is_attribute),
                 dict(name="id", attrs=dict(id="a")),
                 True,
             ),
             (
-                dict(function=lambda t: t.name in t.attrs),
+                dict(function=_name_is_attribute),
                 dict(name="id", attrs={"class": "a"}),
                 False,
             ),
@@ -264,6 +339,16 @@ class TestTagNameMatchRule(SoupTest):
         tag = Tag(**tag_kwargs)
         assert rule.matches_tag(tag) == result
 
+    def test_literal_name_is_interned(self):
+        name = "".join(["sec", "tion"])
+        assert name is not sys.intern("section")
+        rule = TagNameMatchRule(string=name)
+        assert rule.string is sys.intern("section")
+
+        # Subclasses of str can't be interned, and are left alone.
+        rule = TagNameMatchRule(string=NavigableString("section"))
+        assert rule.matches_tag(Tag(name="section"))
+
     def test_matches_tag_only_passes_tag_to_function(self):
         def arg1_must_be_tag(t):
             if not isinstance(t, Tag):
@@ -330,6 +415,16 @@ class TestSoupStrainer(SoupTest):
     def _match_function(x):
         pass
 
+    # Dummy object that acts like a compiled regular expression from
+    # the third-party ``regex`` package, without being an re.Pattern.
+    class _RegexLike:
+        pattern = "a"
+
+        def search(self, string, pos=0, endpos=None):
+            return None
+
+    _regex_like = _RegexLike()
+
     def test_constructor_default(self):
         # The default SoupStrainer matches all tags, and only tags.
         strainer = SoupStrainer()
@@ -348,15 +443,15 @@ class TestSoupStrainer(SoupTest):
         [name_rule] = strainer.name_rules
         assert name_rule == TagNameMatchRule(string="tagname")
 
-        [attr1_rule] = strainer.attribute_rules.pop("attr1")
+        assert ["attr1", "attr2"] == list(strainer.attribute_rules)
+
+        [attr1_rule] = strainer.attribute_rules["attr1"]
         assert attr1_rule == AttributeValueMatchRule(string="value")
 
-        [attr2_rule1, attr2_rule2] = strainer.attribute_rules.pop("attr2")
+        [attr2_rule1, attr2_rule2] = strainer.attribute_rules["attr2"]
         assert attr2_rule1 == AttributeValueMatchRule(string="value1")
         assert attr2_rule2 == AttributeValueMatchRule(present=False)
 
-        assert not strainer.attribute_rules
-
         [string_rule] = strainer.string_rules
         assert string_rule == StringMatchRule(function=self._match_function)
 
@@ -364,9 +459,9 @@ class TestSoupStrainer(SoupTest):
         # For the sake of convenience, passing a scalar value as
         # ``args`` results in a restriction on the 'class' attribute.
         strainer = SoupStrainer(attrs="mainbody")
-        assert [] == strainer.name_rules
-        assert [] == strainer.string_rules
-        assert {"class": [AttributeValueMatchRule(string="mainbody")]} == (
+        assert () == strainer.name_rules
+        assert () == strainer.string_rules
+        assert {"class": (AttributeValueMatchRule(string="mainbody"),)} == (
             strainer.attribute_rules
         )
 
@@ -376,9 +471,9 @@ class TestSoupStrainer(SoupTest):
         # keyword argument results in a restriction on the 'class'
         # attribute.
         strainer = SoupStrainer(class_="mainbody")
-        assert [] == strainer.name_rules
-        assert [] == strainer.string_rules
-        assert {"class": [AttributeValueMatchRule(string="mainbody")]} == (
+        assert () == strainer.name_rules
+        assert () == strainer.string_rules
+        assert {"class": (AttributeValueMatchRule(string="mainbody"),)} == (
             strainer.attribute_rules
         )
 
@@ -386,9 +481,9 @@ class TestSoupStrainer(SoupTest):
         # it's not changed. (Otherwise there'd be no way to actually put
         # a restriction on an attribute called "class_".)
         strainer = SoupStrainer(attrs=dict(class_="mainbody"))
-        assert [] == strainer.name_rules
-        assert [] == strainer.string_rules
-        assert {"class_": [AttributeValueMatchRule(string="mainbody")]} == (
+        assert () == strainer.name_rules
+        assert () == strainer.string_rules
+        assert {"class_": (AttributeValueMatchRule(string="mainbody"),)} == (
             strainer.attribute_rules
         )
 
@@ -413,9 +508,12 @@ class TestSoupStrainer(SoupTest):
         [
             ("a", MatchRule(string="a")),
             (b"a", MatchRule(string="a")),
+            # Subclasses of str are treated like str.
+            (NavigableString("a"), MatchRule(string="a")),
             (True, MatchRule(present=True)),
             (False, MatchRule(present=False)),
             (re.compile("a"), MatchRule(pattern=re.compile("a"))),
+            (_regex_like, MatchRule(pattern=_regex_like)),
             (_match_function, MatchRule(function=_match_function)),
             # Pass in a list and get back a list of rules.
             (["a", b"b"], [MatchRule(string="a"), MatchRule(string="b")]),
@@ -426,6 +524,9 @@ class TestSoupStrainer(SoupTest):
                     MatchRule(function=_match_function),
                 ],
             ),
+            # Any other kind of iterable works too.
+            (("a", "b"), [MatchRule(string="a"), MatchRule(string="b")]),
+            (iter(["a", "b"]), [MatchRule(string="a"), MatchRule(string="b")]),
             # Anything that doesn't fit is converted to a string.
             (100, MatchRule(string="100")),
         ],
@@ -493,20 +594,37 @@ class TestSoupStrainer(SoupTest):
     def test_matches_tag_with_only_string(self):
         # A SoupStrainer that only has StringMatchRules won't ever
         # match a Tag.
-        strainer = SoupStrainer(string=["a string", re.compile("string")])
+        string_rules = ["a string", re.compile("string")]
+        strainer = SoupStrainer(string=string_rules)
         tag = Tag(name="b", attrs=dict(id="1"))
         tag.string = "a string"
         assert not strainer.matches_tag(tag)
 
         # There has to be a TagNameMatchRule or an
         # AttributeValueMatchRule as well.
-        strainer.name_rules.append(TagNameMatchRule(string="b"))
+        strainer = SoupStrainer(name="b", string=string_rules)
         assert strainer.matches_tag(tag)
 
-        strainer.name_rules = []
-        strainer.attribute_rules["id"] = [AttributeValueMatchRule("1")]
+        strainer = SoupStrainer(id="1", string=string_rules)
         assert strainer.matches_tag(tag)
 
+    def test_rules_cannot_be_modified(self):
+        # The rules are analyzed when the SoupStrainer is created, so
+        # trying to change them afterwards fails instead of being
+        # silently ignored.
+        strainer = SoupStrainer(name="a", id="1", string="a string")
+        with pytest.raises(AttributeError):
+            strainer.name_rules.append(TagNameMatchRule(string="b"))
+        with pytest.raises(AttributeError):
+            strainer.string_rules.append(StringMatchRule(string="b"))
+        with pytest.raises(AttributeError):
+            strainer.attribute_rules["id"].append(AttributeValueMatchRule("2"))
+        with pytest.raises(TypeError):
+            strainer.attribute_rules["class"] = (AttributeValueMatchRule("b"),)
+        with pytest.raises(AttributeError):
+            strainer.attribute_rules.pop("id")
+        assert ["id"] == list(strainer.attribute_rules)
+
     def test_matches_tag_with_prefix(self):
         # If a tag has an attached namespace prefix, the tag's name is
         # tested both with and without the prefix.
@@ -515,6 +633,32 @@ class TestSoupStrainer(SoupTest):
         assert self.tag_matches(SoupStrainer(name="a"), **kwargs)
         assert self.tag_matches(SoupStrainer(name="ns:a"), **kwargs)
         assert not self.tag_matches(SoupStrainer(name="ns2:a"), **kwargs)
+        assert self.tag_matches(SoupStrainer(name=re.compile("^ns:")), **kwargs)
+
+        # Literal names match whether or not they include the prefix.
+        strainer = SoupStrainer(name=["b", "a"])
+        assert self.tag_matches(strainer, **kwargs)
+        assert not self.tag_matches(strainer, name="c", prefix="ns")
+        strainer = SoupStrainer(name=["b", "ns:a"])
+        assert self.tag_matches(strainer, **kwargs)
+        assert not self.tag_matches(strainer, name="a", prefix="ns2")
+
+        # A function is given the name and then the prefixed name by
+        # allow_tag_creation, but matches_tag gives it the Tag instead.
+        calls = []
+
+        def function(x):
+            calls.append(x)
+            return x == "ns:a"
+
+        strainer = SoupStrainer(name=function)
+        assert strainer.allow_tag_creation("ns", "a", {})
+        assert ["a", "ns:a"] == calls
+
+        del calls[:]
+        tag = Tag(prefix="ns", name="a")
+        assert not strainer.matches_tag(tag)
+        assert [tag] == calls
 
     def test_one_name_rule_must_match(self):
         # If there are TagNameMatchRule, at least one must match.
@@ -527,6 +671,145 @@ class TestSoupStrainer(SoupTest):
             SoupStrainer(name=[re.compile("c-f"), re.compile("[ab]$")]), **kwargs
         )
 
+    def test_name_rules_combining_literals_and_patterns(self):
+        # Literal tag names are all checked at once, and the other
+        # rules are checked one at a time, but the result is the same
+        # as checking every rule in turn.
+        strainer = SoupStrainer(name=["b", "ns:c", re.compile("^h[1-6]$")])
+        assert self.tag_matches(strainer, "b")
+        assert self.tag_matches(strainer, "c", prefix="ns")
+        assert self.tag_matches(strainer, "h2")
+        assert self.tag_matches(strainer, "h3", prefix="ns")
+        assert not self.tag_matches(strainer, "c")
+        assert not self.tag_matches(strainer, "c", prefix="ns2")
+        assert not self.tag_matches(strainer, "h7")
+
+    def test_name_rules_combining_several_patterns(self):
+        # Several regular expressions can be combined into one, but
+        # the result is the same as checking every rule in turn.
+        strainer = SoupStrainer(
+            name=["b", re.compile("^h[1-6]$"), re.compile("^ns:t"), lambda t: False]
+        )
+        assert self.tag_matches(strainer, "b")
+        assert self.tag_matches(strainer, "h2")
+        assert self.tag_matches(strainer, "td", prefix="ns")
+        assert not self.tag_matches(strainer, "td")
+        assert not self.tag_matches(strainer, "h7")
+
+        # A pattern with flags of its own isn't combined with the others.
+        strainer = SoupStrainer(name=[re.compile("^H1$", re.I), re.compile("^P$")])
+        assert self.tag_matches(strainer, "h1")
+        assert self.tag_matches(strainer, "P")
+        assert not self.tag_matches(strainer, "p")
+
+    def test_allow_tag_creation_stops_at_first_matching_name_rule(self):
+        calls = []
+
+        def function(name):
+            calls.append(name)
+            return False
+
+        strainer = SoupStrainer(name=[re.compile("^a$"), function])
+        assert strainer.allow_tag_creation(None, "a", {})
+        assert [] == calls
+
+        # A function is tried against the name and the prefixed name.
+        assert not strainer.allow_tag_creation("ns", "b", {})
+        assert ["b", "ns:b"] == calls
+
+    def test_many_literal_names(self):
+        # A SoupStrainer can be given a large number of tag names.
+        strainer = SoupStrainer(name=[f"tag{i}" for i in range(50)])
+        markup = "<tag3>a</tag3><other>b</other><tag49>c</tag49><tag50>d</tag50>"
+        soup = self.soup(markup, parse_only=strainer)
+        assert "<tag3>a</tag3><tag49>c</tag49>" == soup.decode()
+
+        soup = self.soup(markup)
+        assert ["tag3", "tag49"] == [x.name for x in soup.find_all(strainer)]
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        # SoupStrainer uses __slots__, but can still be pickled with
+        # any protocol.
+        strainer = SoupStrainer(name="a", class_=["x", re.compile("y")])
+        assert not hasattr(strainer, "__dict__")
+        loaded = pickle.loads(pickle.dumps(strainer, protocol))
+        assert loaded.name_rules == strainer.name_rules
+        assert loaded.attribute_rules == strainer.attribute_rules
+        assert loaded.string_rules == strainer.string_rules
+        assert self.tag_matches(loaded, "a", {"class": ["z", "y"]})
+
+    # A SoupStrainer pickled before __slots__ were introduced, when
+    # state was a plain dictionary and the rules were kept in lists:
+    # pickle.dumps(SoupStrainer("a", class_=["x", re.compile("^y")]), 0)
+    DICT_STATE_PICKLE = (
+        b'ccopy_reg\n_reconstructor\np0\n(cbs4.filter\nSoupStrainer\n'
+        b'p1\nc__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nVname_rules\n'
+        b'p6\n(lp7\ng0\n(cbs4.filter\nTagNameMatchRule\np8\ng2\nNtp9\n'
+        b'Rp10\n(dp11\nVstring\np12\nVa\np13\nsVpattern\np14\n'
+        b'NsVfunction\np15\nNsVpresent\np16\nNsVexclude_everything\n'
+        b'p17\nNsbasVattribute_rules\np18\nccollections\ndefaultdict\n'
+        b'p19\n(c__builtin__\nlist\np20\ntp21\nRp22\nVclass\np23\n'
+        b'(lp24\ng0\n(cbs4.filter\nAttributeValueMatchRule\np25\ng2\n'
+        b'Ntp26\nRp27\n(dp28\ng12\nVx\np29\nsg14\nNsg15\nNsg16\nNsg17\n'
+        b'Nsbag0\n(g25\ng2\nNtp30\nRp31\n(dp32\ng12\nNsg14\ncre\n'
+        b'_compile\np33\n(V^y\np34\nI32\ntp35\nRp36\nsg15\nNsg16\n'
+        b'Nsg17\nNsbassVstring_rules\np37\n(lp38\n'
+        b'sV_SoupStrainer__string\np39\nNsb.'
+    )
+
+    def test_unpickle_dict_state(self):
+        loaded = pickle.loads(self.DICT_STATE_PICKLE)
+        assert (TagNameMatchRule(string="a"),) == loaded.name_rules
+        assert {
+            "class": (
+                AttributeValueMatchRule(string="x"),
+                AttributeValueMatchRule(pattern=re.compile("^y")),
+            )
+        } == loaded.attribute_rules
+        assert () == loaded.string_rules
+
+        # The analyzed state was rebuilt, so the strainer works.
+        assert self.tag_matches(loaded, "a", {"class": "x"})
+        assert self.tag_matches(loaded, "a", {"class": ["z", "yz"]})
+        assert not self.tag_matches(loaded, "a", {"class": "z"})
+        assert not self.tag_matches(loaded, "b", {"class": "x"})
+        assert loaded.allow_tag_creation(None, "a", {"class": "yz"})
+        assert not loaded.allow_tag_creation(None, "b", {"class": "yz"})
+
+        # So does each of its rules.
+        [name_rule] = loaded.name_rules
+        assert True is name_rule.matches_string("a")
+        assert False is name_rule.matches_string("b")
+
+    def test_attributes_with_cheap_rules_are_checked_first(self):
+        checked = []
+
+        def function(value):
+            checked.append(value)
+            return True
+
+        strainer = SoupStrainer(
+            attrs={"a": function, "b": re.compile("x"), "c": "1", "d": True}
+        )
+
+        # The rules are kept in the order they were given.
+        assert ["a", "b", "c", "d"] == list(strainer.attribute_rules)
+
+        # But the function is never called, because a cheaper rule
+        # has already ruled the tag out.
+        assert not self.tag_matches(
+            strainer, "b", {"a": "1", "b": "x", "c": "2", "d": "1"}
+        )
+        assert [] == checked
+
+        # Once every cheaper rule has passed, the function is called,
+        # once by matches_tag() and once by allow_tag_creation().
+        assert self.tag_matches(
+            strainer, "b", {"a": "1", "b": "x", "c": "1", "d": "1"}
+        )
+        assert ["1", "1"] == checked
+
     def test_one_attribute_rule_must_match_for_each_attribute(self):
         # If there is one or more AttributeValueMatchRule for a given
         # attribute, at least one must match that attribute's
@@ -568,11 +851,59 @@ class TestSoupStrainer(SoupTest):
         assert self.tag_matches(SoupStrainer(attrs=["big", "small"]), **kwargs)
         assert not self.tag_matches(SoupStrainer(attrs=["small", "smaller"]), **kwargs)
 
+        # A list of literal strings can also match all of the values
+        # joined together, in their original order.
+        assert self.tag_matches(SoupStrainer(attrs=["main big", "small"]), **kwargs)
+        assert not self.tag_matches(
+            SoupStrainer(attrs=["big main", "small"]), **kwargs
+        )
+
+        # The same rules with a regular expression mixed in are
+        # combined into one regular expression rather than checked
+        # with a set lookup, but give the same answers.
+        strainer = SoupStrainer(attrs=["big", "small", re.compile("^x")])
+        assert self.tag_matches(strainer, **kwargs)
+        assert self.tag_matches(strainer, "b", {"class": ["y", "xy"]})
+        assert not self.tag_matches(
+            strainer, "b", {"class": ["bigger", "smal", "ax"]}
+        )
+
+        # A function can't be combined with the other rules, so all
+        # of them are checked one at a time, and the function sees
+        # each value, then the joined value.
+        checked = []
+
+        def function(value):
+            checked.append(value)
+            return False
+
+        strainer = SoupStrainer(attrs=["small", re.compile("^x"), function])
+        assert not self.tag_matches(strainer, **kwargs)
+        assert ["main", "big", "main big"] == checked
+
+    def test_match_against_unhashable_attribute_value(self):
+        # An attribute value that was set to something unhashable
+        # doesn't match any string, and doesn't cause an error.
+        kwargs = dict(name="b", attrs={"data": {"k": 1}})
+        assert not self.tag_matches(SoupStrainer(data="v"), **kwargs)
+        assert not self.tag_matches(SoupStrainer(data=["v", "w"]), **kwargs)
+
+        soup = self.soup("<a>x</a>")
+        soup.a["data"] = {"k": 1}
+        assert [] == soup.find_all(data="v")
+
     def test_match_against_multi_valued_attribute_as_string(self):
         # If an attribute has multiple values, you can treat the entire
         # thing as one string during a match.
         kwargs = dict(name="b", attrs={"class": ["main", "big"]})
         assert self.tag_matches(SoupStrainer(attrs="main big"), **kwargs)
+        assert self.tag_matches(SoupStrainer(attrs=re.compile("n b")), **kwargs)
+        assert self.tag_matches(
+            SoupStrainer(attrs=re.compile("N B", re.I)), **kwargs
+        )
+        assert self.tag_matches(
+            SoupStrainer(attrs=["main big", re.compile("^x")]), **kwargs
+        )
 
         # But you can't put them in any order; it's got to be the
         # order they are present in the Tag, which basically means the
@@ -620,6 +951,29 @@ class TestSoupStrainer(SoupTest):
             string=["Wrong string", "Also wrong", re.compile("string")],
         ).matches_tag(tag)
 
+    @pytest.mark.parametrize(
+        "rules",
+        [
+            ["a.b", "c"],
+            ["a.b", re.compile("^x+$"), re.compile("c$")],
+            ["a.b", re.compile("^x"), re.compile("c"), lambda s: s == "xx"],
+            # These patterns can't be combined, but they still work.
+            ["a.b", re.compile("X+", re.I), re.compile("c")],
+            ["a.b", re.compile("(x)\\1"), re.compile("c")],
+            ["a.b", re.compile("c"), lambda s: s == "xx"],
+            [True, "a.b"],
+        ],
+    )
+    def test_matches_any_string_rule(self, rules):
+        # Several regular expressions may be combined into one, but
+        # the results are the same as checking the rules one at a
+        # time.
+        strainer = SoupStrainer(string=rules)
+        for string in ("a.b", "c", "xx", "XX", "axb", "a.bc", "x\n", "\nc"):
+            expect = any(rule.matches_string(string) for rule in strainer.string_rules)
+            assert expect == strainer.matches_any_string_rule(string)
+        assert strainer.matches_any_string_rule("a.b")
+
     def test_allowing_tag_implies_allowing_its_contents(self):
         markup = "<a><b>one string<div>another string</div></b></a>"
 
@@ -9,6 +9,7 @@ cases represent the same problem, and puts the test cases in close
 proximity to code that can trigger the problems.
 """
 
+import functools
 import os
 import importlib
 import pytest # type:ignore
@@ -26,6 +27,16 @@ except ImportError:
     FULLY_FUZZABLE = False
 
 
+@functools.lru_cache(maxsize=None)
+def _testcase_markup(filename: str) -> bytes:
+    # Several tests may use the same test case, but each file only
+    # needs to be read once.
+    this_dir = os.path.split(__file__)[0]
+    path = os.path.join(this_dir, "fuzz", filename)
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
 @pytest.mark.skipif(
     not FULLY_FUZZABLE, reason="Prerequisites for fuzz tests are not installed."
 )
@@ -161,6 +172,4 @@ class TestFuzz:
     def __markup(self, filename: str) -> bytes:
         if not filename.endswith(self.TESTCASE_SUFFIX):
             filename += self.TESTCASE_SUFFIX
-        this_dir = os.path.split(__file__)[0]
-        path = os.path.join(this_dir, "fuzz", filename)
-        return open(path, "rb").read()
+        return _testcase_markup(filename)
@@ -86,17 +86,17 @@ class TestNavigableStringSubclasses(SoupTest):
         But the return value is ignored.
         """
 
-        self.count = 0
+        count = [0]
 
         def increment(*args):
-            self.count += 1
+            count[0] += 1
             return "BITTER FAILURE"
 
         soup = self.soup("")
         cdata = CData("<><><>")
         soup.insert(1, cdata)
         assert b"<![CDATA[<><><>]]>" == soup.encode(formatter=increment)
-        assert 1 == self.count
+        assert 1 == count[0]
 
     def test_doctype_ends_in_newline(self):
         # Unlike other NavigableString subclasses, a DOCTYPE always ends